@@ -1,4 +1,5 @@
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from rich.console import Console
@@ -26,9 +27,14 @@ def main():
             # (This usually opens the last read book)
             ebook_paths.append(find_file())
         else:
-            for arg in args:
-                path = Path(arg)
-                if path.exists():
+            paths = [Path(arg) for arg in args]
+            # NOTE: stat the files concurrently,
+            # a shell glob like `baca *.epub` can expand to many files
+            with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+                paths_exist = list(executor.map(Path.exists, paths))
+
+            for arg, path, path_exists in zip(args, paths, paths_exist):
+                if path_exists:
                     ebook_paths.append(path)
                 else:
                     console.print(Text(f"File not found: {arg}", style="bold red"))
@@ -1,10 +1,9 @@
 import asyncio
 import dataclasses
+import functools
 from datetime import datetime
 from pathlib import Path
-from typing import List, Type
-import json
-import re
+from typing import List, Optional, Type
 from bidi.algorithm import get_display
 
 from textual import events
@@ -25,9 +24,10 @@ from baca.components.windows import Alert, DictDisplay, SearchInputPrompt, ToC
 from baca.config import load_config
 from baca.ebooks import Ebook
 from baca.exceptions import LaunchingFileError
-from baca.models import Coordinate, KeyMap, ReadingHistory, SearchMode
+from baca.models import Coordinate, KeyMap, ReadingHistory, SearchMode, TocEntry, db
 from baca.utils.app_resources import get_resource_file
-from baca.utils.keys_parser import dispatch_key
+from baca.utils.keys_parser import build_keymap_table, dispatch_key
+from baca.utils.matches import load_match_index
 from baca.utils.systems import launch_file
 from baca.utils.urls import is_url
 from baca.models import Coordinate
@@ -38,15 +38,25 @@ class ReadingSession:
     content: Content
     ebook_state: ReadingHistory
     reading_progress: float = 0.0
+    # whether ebook_state needs to be saved on exit
+    dirty: bool = False
 
-    def contains_hebrew(self, txt: str):
-        return bool(re.search(r'[\u0590-\u05FF]', txt))
+    @property
+    def lang(self) -> str:
+        # same as the keys of matches.json records
+        return "heb" if self.content.is_rtl else "eng"
+
+    @functools.cached_property
+    def toc_entries(self) -> list[TocEntry]:
+        return list(self.ebook.get_toc())
 
-    def __post_init__(self):
-        """Runs automatically after the dataclass is initialized."""
-        ebook_name = self.ebook.get_path().name
-        if self.contains_hebrew(ebook_name):
-            self.content.set_rtl_true()
+    @functools.cached_property
+    def toc_value_to_index(self) -> dict[str, int]:
+        value_to_index: dict[str, int] = {}
+        for n, entry in enumerate(self.toc_entries):
+            # first entry wins, same as list.index()
+            value_to_index.setdefault(entry.value, n)
+        return value_to_index
 
 
 class Baca(App):
@@ -58,45 +68,61 @@ class Baca(App):
         self.ebook_paths = ebook_paths
         self.ebook_class = ebook_class
 
-        self.sessions: List[ReadingSession] = []
+        # Books other than the first one are loaded on their first switch
+        self.sessions: List[Optional[ReadingSession]] = [None] * len(ebook_paths)
         self.current_index: int = 0
         self.reading_progress = 0.0
         self.search_mode = None
 
+        # eng <-> heb alignment index, loaded in background on startup
+        self._match_index_task: asyncio.Task[dict[str, str]] | None = None
+
+        # windows mounted by this app, see the *_window properties below
+        self._toc_window: ToC | None = None
+        self._metadata_window: DictDisplay | None = None
+        self._help_window: DictDisplay | None = None
+
     def on_load(self, _: events.Load) -> None:
         # Use create_task for background loading to avoid run_worker error
         assert self._loop is not None
-        asyncio.create_task(self.load_all_sessions())
-
-    async def load_all_sessions(self):
-        """Loads all books into memory but hides all except the first."""
-        for i, path in enumerate(self.ebook_paths):
-            # Load book data in a thread to keep UI responsive
-            ebook = await asyncio.to_thread(self.ebook_class, path)
-            content = Content(self.config, ebook)
-
-            # Hide all books except the first one
-            content.display = (i == 0)
-
-            ebook_state, _ = await asyncio.to_thread(
-                ReadingHistory.get_or_create,
-                filepath=str(ebook.get_path()),
-                defaults=dict(reading_progress=0.0)
-            )
+        asyncio.create_task(self.load_initial_session())
+        # NOTE: a single book never switches, so it never needs the alignment index
+        if len(self.ebook_paths) > 1:
+            self._match_index_task = asyncio.create_task(asyncio.to_thread(load_match_index))
+
+    async def load_ebook(self, path: Path) -> tuple[Ebook, ReadingHistory]:
+        # Load book data in a thread to keep UI responsive
+        ebook = await asyncio.to_thread(self.ebook_class, path)
+        ebook_state, _ = await asyncio.to_thread(
+            ReadingHistory.get_or_create,
+            filepath=str(ebook.get_path()),
+            defaults=dict(reading_progress=0.0)
+        )
+        return ebook, ebook_state
 
-            session = ReadingSession(
-                ebook=ebook,
-                content=content,
-                ebook_state=ebook_state,
-                reading_progress=ebook_state.reading_progress
-            )
-            self.sessions.append(session)
+    async def load_session(self, index: int) -> ReadingSession:
+        ebook, ebook_state = await self.load_ebook(self.ebook_paths[index])
+        content = Content(self.config, ebook)
+
+        # Hide all books except the current one
+        content.display = (index == self.current_index)
 
-            # Mount it immediately so it stays in the DOM
-            await self.mount(content)
+        session = ReadingSession(
+            ebook=ebook,
+            content=content,
+            ebook_state=ebook_state,
+            reading_progress=ebook_state.reading_progress
+        )
+        self.sessions[index] = session
 
-        if self.sessions:
-            self.post_message(DoneLoading(self.sessions[0].content))
+        # Mount it immediately so it stays in the DOM
+        await self.mount(content)
+        return session
+
+    async def load_initial_session(self):
+        """Loads the first book, the others are loaded when switched to."""
+        session = await self.load_session(0)
+        self.post_message(DoneLoading(session.content))
 
     async def on_done_loading(self, event: DoneLoading) -> None:
         def restore_initial_state() -> None:
@@ -113,123 +139,116 @@ class Baca(App):
 
         self.call_after_refresh(restore_initial_state)
 
+    async def get_matching_lines(self, lines_to_match: str) -> str | None:
+        # NOTE: never parse matches.json on the event loop,
+        # wait for the background load if it isn't done yet
+        assert self._match_index_task is not None
+        try:
+            matching_lines = await self._match_index_task
+        except Exception:
+            # e.g. a malformed matches.json, treat it as no matches
+            # so the books are reported as unaligned instead
+            return None
+
+        # fix hebrew lines
+        return matching_lines.get(get_display(lines_to_match))
+
     async def action_switch_book(self) -> None:
         """Instantly toggles visibility between open books."""
-        if len(self.sessions) < 2:
+        current_session = self.sessions[self.current_index]
+        if len(self.sessions) < 2 or current_session is None:
             return
 
-        # 0. Get visible sentences in current book before switching
-        current_session = self.sessions[self.current_index]
         current_y = int(self.screen.scroll_offset.y)
-        current_session_lines = current_session.content.get_n_visible_sentences(current_y=current_y, n=5)
 
-        # 1. Save progress of current book
+        # 0. Save progress of current book
         if self.screen.max_scroll_y > 0:
-            self.sessions[self.current_index].reading_progress = self.screen.scroll_y / self.screen.max_scroll_y
-
-        # 2. Hide current book
-        current_session.content.display = False
-
-        # 3. Increment index
-        self.current_index = (self.current_index + 1) % len(self.sessions)
-        next_session = self.sessions[self.current_index]
-
-        # 4. Show the next book
-        next_session.content.display = True
-
-        # 5. Alignment
-        async def perform_alignment(current_session_lines):
-            def get_matching_lines_from_json(lines_to_match, json_pth='matches.json'):
-                # fix hebrew lines
-                lines_to_match = get_display(lines_to_match)
-
-                # Open the file with utf-8 encoding to support Hebrew
-                with open(json_pth, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                # read lines from json and compare - make sure json's frame size and n are equals
-                for lines_json in data:
-                    if 'Vin sat quietly in one' in lines_json['eng']:
-                        pass
-                    if lines_json['eng'] == lines_to_match:
-                        return lines_json['heb']
-                    if lines_json['heb'] == lines_to_match:
-                        return lines_json['eng']
-
-                # no matches
-                return None
+            current_session.reading_progress = self.screen.scroll_y / self.screen.max_scroll_y
+            current_session.dirty = True
+
+        # 1. Load the next book if this is the first time switching to it
+        next_index = (self.current_index + 1) % len(self.sessions)
+        next_session = self.sessions[next_index]
+        if next_session is None:
+            loading_alert = Alert(self.config, "Loading...")
+            await self.mount(loading_alert)
+            try:
+                next_session = await self.load_session(next_index)
+            except Exception as e:
+                # NOTE: stay on the current book, loading it is retried on the next switch
+                await self.alert(f"Error loading {self.ebook_paths[next_index].name}: {e}")
+                return
+            finally:
+                await loading_alert.remove()
+
+        # 2. Get visible sentences in current book before switching
+        # NOTE: matches.json only aligns eng <-> heb,
+        # books in the same language skip the alignment altogether
+        current_session_lines = (
+            current_session.content.get_n_visible_sentences(current_y=current_y, n=5)
+            if current_session.lang != next_session.lang
+            else None
+        )
 
-            # get the lines to search for in next session
-            next_session_lines = get_matching_lines_from_json(lines_to_match=current_session_lines)
+        # 3. Hide current book, increment index & show the next book
+        # batched so the swap is laid out and repainted once
+        with self.batch_update():
+            current_session.content.display = False
+            self.current_index = next_index
+            next_session.content.display = True
 
+        # 4. Alignment
+        async def perform_alignment(current_session_lines: str | None):
             # Force focus so the app knows which widget is active
             next_session.content.focus()
 
-            # Calc estimated location to start with
             if self.screen.max_scroll_y > 0:
-                target_y = current_session.reading_progress * self.screen.max_scroll_y
-                self.screen.scroll_to(None, target_y, duration=0, animate=False)
-
-                # 1. Get current scroll position to use as the starting point
-                current_y = int(self.screen.scroll_offset.y)
-                start_pos = Coordinate(x=-1, y=current_y)
-
-                # 2. Search in a radius from current line
-                if next_session_lines:
-                    match_y = await next_session.content.alignment_search(
-                        pattern_str=next_session_lines,
-                        current_coord=start_pos,
-                        radius=1000
-                    )
+                if current_session_lines is None:
+                    # Same language, nothing to align: restore the book's own saved progress
+                    target_y = next_session.reading_progress * self.screen.max_scroll_y
+                    self.screen.scroll_to(None, target_y, duration=0, animate=False)
                 else:
-                    match_y = None
-
-                # 3. Scroll result to the first line of the screen
-                if match_y:
-                    self.screen.scroll_to(y=match_y, animate=False)
-                else:
-                    await self.alert(f"Couldn't align books :(")
+                    # Calc estimated location to start the alignment search from
+                    target_y = current_session.reading_progress * self.screen.max_scroll_y
+                    self.screen.scroll_to(None, target_y, duration=0, animate=False)
+                    await align_to(current_session_lines)
 
             self.title = f"Baca | {next_session.ebook.get_meta().title}"
 
+        async def align_to(current_session_lines: str):
+            # get the lines to search for in next session
+            next_session_lines = await self.get_matching_lines(current_session_lines)
+
+            # 1. Get current scroll position to use as the starting point
+            current_y = int(self.screen.scroll_offset.y)
+            start_pos = Coordinate(x=-1, y=current_y)
+
+            # 2. Search in a radius from current line
+            if next_session_lines:
+                match_y = await next_session.content.alignment_search(
+                    pattern_str=next_session_lines,
+                    current_coord=start_pos,
+                    radius=1000
+                )
+            else:
+                match_y = None
+
+            # 3. Scroll result to the first line of the screen
+            if match_y:
+                self.screen.scroll_to(y=match_y, animate=False)
+            else:
+                await self.alert(f"Couldn't align books :(")
+
         # We refresh layout first, then run the switch logic
         self.refresh(layout=True)
         self.call_after_refresh(perform_alignment, current_session_lines)
 
     def on_mount(self):
-        def screen_watch_scroll_y_wrapper(old_watcher, screen):
-            def new_watcher(old, new):
-                result = old_watcher(old, new)
-                if screen.max_scroll_y != 0:
-                    self.reading_progress = new / screen.max_scroll_y
-                return result
-
-            return new_watcher
-
-        screen_scroll_y_watcher = getattr(self.screen, "watch_scroll_y")
-        setattr(self.screen, "watch_scroll_y", screen_watch_scroll_y_wrapper(screen_scroll_y_watcher, self.screen))
-
-    @property
-    def ebook(self) -> Ebook:
-        return self.sessions[self.current_index].ebook
-
-    @property
-    def ebook_state(self) -> ReadingHistory:
-        return self.sessions[self.current_index].ebook_state
+        # NOTE: screen's own watch_scroll_y still runs, this is called right after it
+        self.watch(self.screen, "scroll_y", self.update_reading_progress, init=False)
 
-    @property
-    def content(self) -> Content:
-        """Find the currently visible content widget."""
-        return self.sessions[self.current_index].content
-
-    async def on_key(self, event: events.Key) -> None:
         keymaps = self.config.keymaps
-
-        if event.key == "tab":
-            await self.action_switch_book()
-            return
-
-        await dispatch_key(
+        self.keymap_table = build_keymap_table(
             [
                 KeyMap(keymaps.close, self.action_cancel_search_or_quit),
                 KeyMap(keymaps.scroll_down, self.screen.action_scroll_down),
@@ -248,10 +267,33 @@ class Baca(App):
                 KeyMap(keymaps.next_match, self.action_search_next),
                 KeyMap(keymaps.prev_match, self.action_search_prev),
                 KeyMap(keymaps.confirm, self.action_stop_search),
-            ],
-            event,
+            ]
         )
 
+    def update_reading_progress(self, scroll_y: float) -> None:
+        if self.screen.max_scroll_y != 0:
+            self.reading_progress = scroll_y / self.screen.max_scroll_y
+
+    @property
+    def ebook(self) -> Ebook:
+        return self.sessions[self.current_index].ebook
+
+    @property
+    def ebook_state(self) -> ReadingHistory:
+        return self.sessions[self.current_index].ebook_state
+
+    @property
+    def content(self) -> Content:
+        """Find the currently visible content widget."""
+        return self.sessions[self.current_index].content
+
+    async def on_key(self, event: events.Key) -> None:
+        if event.key == "tab":
+            await self.action_switch_book()
+            return
+
+        await dispatch_key(self.keymap_table, event)
+
     def compose(self) -> ComposeResult:
         yield LoadingIndicator(id="startup-loader")
 
@@ -266,6 +308,7 @@ class Baca(App):
                 config=self.config, id="metadata", title="Metadata", data=dataclasses.asdict(self.ebook.get_meta())
             )
             await self.mount(metadata_window)
+            self._metadata_window = metadata_window
 
     def action_page_down(self) -> None:
         if not self.screen.allow_vertical_scroll:
@@ -316,22 +359,25 @@ class Baca(App):
             }
             help_window = DictDisplay(config=self.config, id="help", title="Keymaps", data=keymap_data)
             await self.mount(help_window)
+            self._help_window = help_window
 
     async def action_open_toc(self) -> None:
         if self.toc_window is None:
-            toc_entries = list(self.ebook.get_toc())
+            session = self.sessions[self.current_index]
+            toc_entries = session.toc_entries
             if len(toc_entries) == 0:
                 return await self.alert("No content navigations for this ebook.")
             initial_index = 0
-            toc_values = [e.value for e in toc_entries]
             for s in self.content.get_navigables():
-                if s.nav_point is not None and s.nav_point in toc_values:
+                toc_index = session.toc_value_to_index.get(s.nav_point)  # type: ignore
+                if toc_index is not None:
                     if self.screen.scroll_offset.y >= s.virtual_region.y:
-                        initial_index = toc_values.index(s.nav_point)
+                        initial_index = toc_index
                     else:
                         break
             toc = ToC(self.config, entries=toc_entries, initial_index=initial_index)
             await self.mount(toc)
+            self._toc_window = toc
 
     async def action_cancel_search_or_quit(self) -> None:
         if self.search_mode is not None:
@@ -348,7 +394,7 @@ class Baca(App):
                 await launch_file(link)
             except LaunchingFileError as e:
                 await self.alert(str(e))
-        elif link in [n.nav_point for n in self.content.get_navigables()]:
+        elif link in self.content.nav_points:
             self.content.scroll_to_section(link)
         else:
             await self.alert(f"No nav point found in document: {link}")
@@ -369,11 +415,17 @@ class Baca(App):
         self.call_after_refresh(self.toc_window.remove)
 
     async def on_open_this_image(self, message: OpenThisImage) -> None:
+        ebook = self.ebook
+
+        def dump_image() -> Path:
+            filename, bytestr = ebook.get_img_bytestr(message.value)
+            tmpfilepath = ebook.get_tempdir() / filename
+            tmpfilepath.write_bytes(bytestr)
+            return tmpfilepath
+
         try:
-            filename, bytestr = self.ebook.get_img_bytestr(message.value)
-            tmpfilepath = self.ebook.get_tempdir() / filename
-            with open(tmpfilepath, "wb") as img_tmp:
-                img_tmp.write(bytestr)
+            # Extract & write the image in a single thread hop to keep UI responsive
+            tmpfilepath = await asyncio.to_thread(dump_image)
             await launch_file(tmpfilepath, preferred=self.config.preferred_image_viewer)
         except LaunchingFileError as e:
             await self.alert(f"Error opening an image: {e}")
@@ -385,16 +437,25 @@ class Baca(App):
         try:
             return super().run(*args, **kwargs)
         finally:
-            for session in self.sessions:
-                meta = session.ebook.get_meta()
-                session.ebook_state.last_read = datetime.now()
-                session.ebook_state.title = meta.title
-                session.ebook_state.author = meta.creator
-                if session == self.sessions[self.current_index]:
-                    session.ebook_state.reading_progress = self.reading_progress
-                else:
-                    session.ebook_state.reading_progress = session.reading_progress
-                session.ebook_state.save()
+            current_session = self.sessions[self.current_index]
+            sessions = [session for session in self.sessions if session is not None]
+
+            # Save every reading history in a single transaction
+            with db.atomic():
+                for session in sessions:
+                    if session is current_session:
+                        session.reading_progress = self.reading_progress
+                        session.dirty = True
+                    # Only books read in this run, or missing their metadata, need their history updated
+                    if session.dirty or not session.ebook_state.title:
+                        meta = session.ebook.get_meta()
+                        session.ebook_state.last_read = datetime.now()
+                        session.ebook_state.title = meta.title
+                        session.ebook_state.author = meta.creator
+                        session.ebook_state.reading_progress = session.reading_progress
+                        session.ebook_state.save()
+
+            for session in sessions:
                 session.ebook.cleanup()
 
     def get_css_variables(self):
@@ -415,21 +476,20 @@ class Baca(App):
 
     @property
     def toc_window(self) -> ToC | None:
-        try:
-            return self.query_one(ToC.__name__, ToC)
-        except NoMatches:
-            return None
+        # NOTE: windows remove themselves when closed,
+        # so drop the reference once it is detached from the DOM
+        if self._toc_window is not None and not self._toc_window.is_attached:
+            self._toc_window = None
+        return self._toc_window
 
     @property
     def metadata_window(self) -> DictDisplay | None:
-        try:
-            return self.get_widget_by_id("metadata", DictDisplay)
-        except NoMatches:
-            return None
+        if self._metadata_window is not None and not self._metadata_window.is_attached:
+            self._metadata_window = None
+        return self._metadata_window
 
     @property
     def help_window(self) -> DictDisplay | None:
-        try:
-            return self.get_widget_by_id("help", DictDisplay)
-        except NoMatches:
-            return None
\ No newline at end of file
+        if self._help_window is not None and not self._help_window.is_attached:
+            self._help_window = None
+        return self._help_window
@@ -1,7 +1,11 @@
 import io
 import re
+from bisect import bisect_right
+from collections import deque
+from functools import lru_cache
+from itertools import accumulate
 from marshal import dumps
-from typing import Any, Coroutine
+from typing import Any, Coroutine, Iterable, Iterator
 from urllib.parse import urljoin
 
 from climage import climage
@@ -10,9 +14,11 @@ from rich.markdown import Markdown
 from rich.text import Text
 from rich.segment import Segment
 from textual import events
+from textual._styles_cache import StylesCache
 from textual.app import ComposeResult
-from textual.geometry import Region
+from textual.geometry import Region, Size
 from textual.strip import Strip
+from textual.timer import Timer
 from textual.widget import Widget
 from textual.widgets import DataTable
 from textual.widgets.markdown import Markdown as PrettyMarkdown
@@ -20,10 +26,58 @@ from textual.widgets.markdown import Markdown as PrettyMarkdown
 from baca.components.events import OpenThisImage
 from baca.ebooks import Ebook
 from baca.models import Config, Coordinate, SegmentType
+from baca.utils.rtl import cached_get_display, contains_hebrew, is_hebrew_language
 from baca.utils.urls import is_url
 
 from bidi.algorithm import get_display
 
+
+@lru_cache(maxsize=4096)
+def _resolve_link(nav_point: str | None, link: str) -> str:
+    return link if is_url(link) or nav_point is None else urljoin(nav_point, link)
+
+
+@lru_cache(maxsize=10_000)
+def _link_meta(link: str) -> bytes:
+    # NOTE: the same for every repaint of a link, no need to marshal it again
+    return dumps({"@click": f"link({link!r})"})
+
+
+def _ansi_size(ebook: Ebook, src: str, width: int) -> tuple[int, int]:
+    img_width, img_height = ebook.get_img_size(src)
+    # NOTE: -1 for precaution on rounding of screen width
+    width -= 1
+    # NOTE: same size climage resizes to, rows are kept even
+    # since it draws two pixel rows per line
+    height = int(img_height // (img_width / width))
+    return width, height - height % 2
+
+
+# NOTE: so resizing back to a previous width doesn't decode again,
+# bounded since a drag-resize goes through many widths
+@lru_cache(maxsize=64)
+def _render_ansi_image(ebook: Ebook, src: str, width: int) -> Text:
+    width, height = _ansi_size(ebook, src, width)
+    img = PILImage.open(io.BytesIO(ebook.get_img_bytestr(src)[1]))
+    # NOTE: lets libjpeg decode at a reduced scale that still covers the target size
+    # (no-op for other formats)
+    img.draft("RGB", (width, height))
+    img = img.convert("RGB")
+    # NOTE: shrink before handing over to climage so its own resize becomes a no-op
+    if img.width > width:
+        full_img, img = img, img.resize((width, height), PILImage.Resampling.BILINEAR)
+        full_img.close()
+    img_ansi = climage._toAnsi(
+        img,
+        oWidth=width,
+        is_unicode=True,
+        color_type=climage.color_types.truecolor,
+        palette="default",
+    )
+    img.close()
+    return Text.from_ansi(img_ansi)
+
+
 class Table(DataTable):
     can_focus = False
 
@@ -44,19 +98,35 @@ class SegmentWidget(Widget):
         super().__init__()
         self.config = config
         self.nav_point = nav_point
+        # rendered text of every line keyed by rtl_fix, valid for _line_cache_size only
+        self._line_cache: dict[bool, list[str]] = {}
+        self._line_cache_size = Size(0, 0)
 
     def get_text_at(self, y: int, rtl_fix: bool = True) -> str:
+        # NOTE: search & alignment call this for every line in a loop,
+        # so render all lines of this segment at once and reuse them until it is resized
+        size = self.virtual_region_with_margin.size
+        if size != self._line_cache_size:
+            self._line_cache.clear()
+            self._line_cache_size = size
+
+        lines = self._line_cache.get(rtl_fix)
+        if lines is None:
+            lines = self._line_cache[rtl_fix] = self._render_text_lines(rtl_fix)
+        return lines[y] if y < len(lines) else ""
+
+    def _render_text_lines(self, rtl_fix: bool) -> list[str]:
         # We store the preference on the instance temporarily
         self._rtl_fix_override = rtl_fix
 
-        # Clear cache to ensure we don't get a stale 'visual' or 'logical' line
-        self._styles_cache.clear()
-
-        strip = self.render_lines(Region(0, y, self.virtual_region_with_margin.width, 1))[0]
+        # NOTE: render through a throwaway cache so we neither get a stale 'visual' or 'logical' line
+        # nor drop the lines on screen from the regular render cache
+        size = self.virtual_region_with_margin.size
+        strips = StylesCache().render_widget(self, Region(0, 0, size.width, size.height))
 
         # Cleanup
         del self._rtl_fix_override
-        return strip.text
+        return [strip.text for strip in strips]
 
 
 class Body(SegmentWidget):
@@ -64,50 +134,75 @@ class Body(SegmentWidget):
         super().__init__(config, nav_point)
         self.content = content
         self.nav_point = nav_point
-        self.is_rtl = False
+        # NOTE: decided per segment, so the chapters without Hebrew skip the RTL logic entirely
+        self.is_rtl = contains_hebrew(content)
+        # NOTE: self.content never changes, so parsing it once per justify is enough
+        self._markdown_cache: dict[str, Markdown] = {}
+        # NOTE: post-processed lines, valid as long as the key below stays the same
+        self._strip_cache: dict[int, Strip] = {}
+        self._strip_cache_key: tuple | None = None
 
     def render(self):
         align_map = dict(center="center", left="left", right="right", justify="full")
 
         if self.is_rtl:
             # We use 'left' to get a clean raw string for our manual calculations
-            return Markdown(self.content, justify="left")
+            justify = "left"
+        else:
+            # Original GitHub Fallback
+            justify = align_map[self.styles.text_align]  # type: ignore
 
-        # Original GitHub Fallback
-        return Markdown(
-            self.content,
-            justify=align_map[self.styles.text_align]  # type: ignore
-        )
+        markdown = self._markdown_cache.get(justify)
+        if markdown is None:
+            markdown = self._markdown_cache[justify] = Markdown(self.content, justify=justify)  # type: ignore
+        return markdown
 
-    def render_line(self, y: int) -> Strip:
-        strip = super().render_line(y)
+    def _process_links(self, strip: Strip) -> Strip:
+        for s in strip._segments:
+            if s.style is not None and s.style.link is not None:
+                s.style._meta = _link_meta(_resolve_link(self.nav_point, s.style.link))
+        return strip
 
+    def render_line(self, y: int) -> Strip:
         # Check if an override was provided. Default to True if not set.
-        use_rtl_fix = getattr(self, "_rtl_fix_override", True)
-
-        if not self.is_rtl or not use_rtl_fix:
+        # NOTE: LTR books short-circuit before even looking it up
+        use_rtl_fix = self.is_rtl and getattr(self, "_rtl_fix_override", True)
+
+        # NOTE: the Textual lines cache gets dropped on every refresh (ie. link hover),
+        # but the processed line only changes along with these.
+        # The rendered lines come with the widget's colors (ie. dark/light mode) baked in
+        key = (self.size, self.styles.text_align, self.rich_style, self.link_style, self.is_rtl, use_rtl_fix)
+        if key != self._strip_cache_key:
+            self._strip_cache.clear()
+            self._strip_cache_key = key
+
+        strip = self._strip_cache.get(y)
+        if strip is None:
+            strip = self._strip_cache[y] = self._process_line(super().render_line(y), use_rtl_fix)
+        return strip
+
+    def _process_line(self, strip: Strip, use_rtl_fix: bool) -> Strip:
+        if not use_rtl_fix:
             # Skip the Hebrew flipping/justification logic
             # Just do the standard link processing
-            for s in strip._segments:
-                if s.style is not None and s.style.link is not None:
-                    link = (
-                        s.style.link
-                        if is_url(s.style.link) or self.nav_point is None
-                        else urljoin(self.nav_point, s.style.link)
-                    )
-                    s.style._meta = dumps({"@click": f"link({link!r})"})
-            return strip
+            return self._process_links(strip)
 
         # --- Hebrew Logic ---
         line_text = "".join(seg.text for seg in strip._segments).strip()
         if not line_text:
             return strip
 
-        target_width = self.size.width
-        words = line_text.split()
-
         # Accessing the alignment setting correctly via self.styles
         use_full_justify = self.styles.text_align == "justify"
+        has_hebrew = contains_hebrew(line_text)
+
+        # NOTE: lines without Hebrew (English quotes, footnotes, etc.) that don't fill
+        # the width need neither flipping nor justifying, render them as in an LTR book
+        if not has_hebrew and not (use_full_justify and len(line_text) > (self.size.width * 0.8)):
+            return self._process_links(strip)
+
+        target_width = self.size.width
+        words = line_text.split()
 
         if use_full_justify and len(words) > 1 and len(line_text) > (target_width * 0.8):
             total_chars = sum(len(w) for w in words)
@@ -116,18 +211,16 @@ class Body(SegmentWidget):
             space_width = total_spaces_needed // space_slots
             extra_spaces = total_spaces_needed % space_slots
 
-            justified_line = ""
-            for i, word in enumerate(words[:-1]):
-                current_spaces = space_width + (1 if i < extra_spaces else 0)
-                justified_line += word + (" " * current_spaces)
-            justified_line += words[-1]
-            line_text = justified_line
+            # the first extra_spaces gaps get one more space than the others
+            gaps = [" " * (space_width + 1)] * extra_spaces + [" " * space_width] * (space_slots - extra_spaces)
+            line_text = "".join(word + gap for word, gap in zip(words, gaps)) + words[-1]
         else:
             padding_needed = target_width - len(line_text)
             if padding_needed > 0:
                 line_text = line_text + (" " * padding_needed)
 
-        fixed_text = get_display(line_text)
+        # NOTE: bidi leaves ascii-only lines as they are
+        fixed_text = cached_get_display(line_text) if has_hebrew or not line_text.isascii() else line_text
         style = strip._segments[0].style if strip._segments else None
         return Strip([Segment(fixed_text, style)])
 
@@ -138,22 +231,25 @@ class Image(SegmentWidget):
         self.content = src
         self.ebook = ebook
         self._renderable = Text("IMAGE", justify="center")
+        # NOTE: width the ansi image was last rendered for
+        self._rendered_width: int | None = None
 
     def render(self):
         return self._renderable
 
+    def get_content_height(self, container: Size, viewport: Size, width: int) -> int:
+        # NOTE: take up the lines of the ansi image before it's decoded
+        # so the layout (and reading progress) doesn't shift once it's shown
+        if self.config.show_image_as_ansi and self._rendered_width != width and width > 1:
+            return max(_ansi_size(self.ebook, self.content, width)[1] // 2, 1)
+        return super().get_content_height(container, viewport, width)
+
     def show_ansi_image(self):
-        img = PILImage.open(io.BytesIO(self.ebook.get_img_bytestr(self.content)[1])).convert("RGB")
-        img_ansi = climage._toAnsi(
-            img,
-            # NOTE: -1 for precaution on rounding of screen width
-            oWidth=self.size.width - 1,
-            is_unicode=True,
-            color_type=climage.color_types.truecolor,
-            palette="default",
-        )
-        img.close()
-        self._renderable = Text.from_ansi(img_ansi)
+        if self._rendered_width == self.size.width:
+            return
+        self._rendered_width = self.size.width
+        self._renderable = _render_ansi_image(self.ebook, self.content, self.size.width)
+        self._line_cache.clear()
         self.refresh(layout=True)
 
     # TODO: "Click ot Open" on mouse hover
@@ -168,6 +264,7 @@ class PrettyBody(PrettyMarkdown):
     def __init__(self, _: Ebook, config: Config, value: str, nav_point: str | None = None):
         super().__init__(value)
         self.nav_point = nav_point
+        self.is_rtl = contains_hebrew(value)
 
     def get_text_at(self, y: int) -> str | None:
         # TODO: this implementation still has issue in positioning match
@@ -215,7 +312,6 @@ class Content(Widget):
     def __init__(self, config: Config, ebook: Ebook):
         super().__init__()
         self.config = config
-        self.is_rtl = False
 
         self._segments: list[SegmentWidget | PrettyBody] = []
         for segment in ebook.iter_parsed_contents():
@@ -224,22 +320,32 @@ class Content(Widget):
             else:
                 component_cls = Image
             self._segments.append(component_cls(ebook, self.config, segment.content, segment.nav_point))
-
-    def set_rtl_true(self):
-        """Helper to set RTL on itself and all child segments."""
-        self.is_rtl = True
-        for segment in self._segments:
-            segment.is_rtl = True
+        # NOTE: segments decide on their own rendering, but the book's language
+        # (used for aligning books) shouldn't flip over a few Hebrew quotes in an English book
+        language = ebook.get_meta().language
+        if language:
+            self.is_rtl = is_hebrew_language(language)
+        else:
+            text_segments = [s for s in self._segments if not isinstance(s, Image)]
+            self.is_rtl = 2 * sum(s.is_rtl for s in text_segments) > len(text_segments)
+        self._navigables = [s for s in self._segments if s.nav_point is not None]
+        # NOTE: the first segment of a nav point is the one to scroll to
+        self._nav_index: dict[str, SegmentWidget | PrettyBody] = {}
+        for s in self._navigables:
+            self._nav_index.setdefault(s.nav_point, s)  # type: ignore
+        self.nav_points = frozenset(self._nav_index)
+        self._resize_timer: Timer | None = None
+        # NOTE: start line of each segment, rebuilt whenever the layout size changes
+        self._segment_offsets: list[int] = []
+        self._segment_offsets_size: Size | None = None
 
     def get_navigables(self):
-        return [s for s in self._segments if s.nav_point is not None]
+        return self._navigables
 
     def scroll_to_section(self, nav_point: str) -> None:
-        # TODO: add attr TocEntry.uuid so we can query("#{uuid}")
-        for s in self.get_navigables():
-            if s.nav_point == nav_point:
-                s.scroll_visible(top=True)
-                break
+        s = self._nav_index.get(nav_point)
+        if s is not None:
+            s.scroll_visible(top=True)
 
     def on_mouse_scroll_down(self, _: events.MouseScrollDown) -> None:
         self.screen.scroll_down()
@@ -255,21 +361,50 @@ class Content(Widget):
         yield from iter(self._segments)
 
     def get_text_at(self, y: int, rtl_fix: bool = True) -> str | None:
-        accumulated_height = 0
-        for segment in self._segments:
-            segment_height = segment.virtual_region_with_margin.height
-            if accumulated_height + segment_height > y:
-                # Pass the rtl_fix argument to the segment's get_text_at
-                return segment.get_text_at(y - accumulated_height, rtl_fix=rtl_fix)
-            accumulated_height += segment_height
+        if self._segment_offsets_size != self.size:
+            self._segment_offsets = list(
+                accumulate((s.virtual_region_with_margin.height for s in self._segments), initial=0)
+            )
+            self._segment_offsets_size = self.size
+
+        index = bisect_right(self._segment_offsets, y) - 1
+        if 0 <= index < len(self._segments):
+            # Pass the rtl_fix argument to the segment's get_text_at
+            return self._segments[index].get_text_at(y - self._segment_offsets[index], rtl_fix=rtl_fix)
+        return None
+
+    def iter_lookahead(
+            self, line_range: Iterable[int], lookahead_buffer: int, forward: bool = True, rtl_fix: bool = True
+    ) -> Iterator[tuple[int, deque[tuple[int, str]]]]:
+        """
+        Yields each line number of line_range along with the (linenr, text) of it
+        and the following lines in the direction of the search.
+        The window slides along with line_range, so every line is only fetched once.
+        """
+        step = 1 if forward else -1
+        height = self.virtual_size.height
+        window: deque[tuple[int, str]] = deque()
+        next_line: int | None = None
+        for linenr in line_range:
+            # drop the lines we already passed
+            while window and (window[0][0] - linenr) * step < 0:
+                window.popleft()
+            if next_line is None or (next_line - linenr) * step < 0:
+                next_line = linenr
+            # skip the lines before the book's start/end
+            next_line = max(next_line, 0) if forward else min(next_line, height - 1)
+            while 0 <= next_line < height and (next_line - linenr) * step < lookahead_buffer:
+                window.append((next_line, self.get_text_at(next_line, rtl_fix=rtl_fix) or ""))
+                next_line += step
+            yield linenr, window
 
     # TODO: see if you can not use get_display (by using rtl_fix=False in get text)
     async def search_next(
             self, pattern_str: str, current_coord: Coordinate = Coordinate(-1, 0), forward: bool = True
     ) -> Coordinate | None:
-        # 0. Handle Hebrew text
-        if self.is_rtl:
-            pattern_str = get_display(pattern_str)
+        # 0. Handle Hebrew text, Hebrew segments are rendered reordered whatever the book's language
+        if contains_hebrew(pattern_str):
+            pattern_str = cached_get_display(pattern_str)
 
         # 1. Prepare the whitespace-agnostic pattern
         words = pattern_str.split()
@@ -284,18 +419,11 @@ class Content(Widget):
             if forward else reversed(range(0, current_coord.y + 1))
         )
 
-        for linenr in line_range:
+        for linenr, window in self.iter_lookahead(line_range, lookahead_buffer, forward=forward):
             # Create a single block of text from the current line + the buffer
             # This is the "lookahead"
-            lines_to_grab = []
-            for i in range(lookahead_buffer):
-                target_line = linenr + i if forward else linenr - i
-                if 0 <= target_line < self.virtual_size.height:
-                    strip = self.get_text_at(target_line)
-                    if strip:
-                        lines_to_grab.append(strip)
-
-            chunk_text = " ".join(lines_to_grab)
+            first_line_text = window[0][1] if window and window[0][0] == linenr else ""
+            chunk_text = " ".join(text for _, text in window if text)
 
             if chunk_text:
                 match = pattern.search(chunk_text)
@@ -304,7 +432,7 @@ class Content(Widget):
                     # This prevents the search from finding the same match 50 times as we loop
 
                     # Check if the start of the match is within the first line's length
-                    first_line_len = len(self.get_text_at(linenr) or "")
+                    first_line_len = len(first_line_text)
 
                     # We only trigger the match when 'linenr' is actually the starting line of the phrase
                     if match.start() <= first_line_len:
@@ -325,40 +453,21 @@ class Content(Widget):
 
     def text_to_sentences(self, paragraph):
         """
-        Splits a paragraph into a list of sentences using RegEx, treating
-        the period '.' as the primary sentence boundary.
+        Splits a paragraph into a list of sentences in a single pass,
+        treating the period '.' as the primary sentence boundary.
         """
         # 1. Aggressive cleaning to normalize whitespace (still necessary for EPUB text)
-        # The aggressive_clean function is assumed to be defined elsewhere in your file.
-        # If it is not, replace this line with: cleaned_paragraph = ' '.join(paragraph.split())
-        cleaned_paragraph = ' '.join(paragraph.split())
-
-        # 2. RegEx for splitting by period:
-        # Pattern: Finds a period, followed by a space or the end of the string.
-        # The parentheses around the pattern '([.])' ensure the period itself is kept
-        # in the resulting list, allowing it to be attached to the sentence.
-        sentences = re.split(r'([.])\s*', cleaned_paragraph)
-
-        # 3. Reconstruct and clean the result
-        final_sentences = []
-
-        # Sentences are now in the format: [text, ., text, ., text]
-        for i in range(0, len(sentences) - 1, 2):
-            sentence_text = sentences[i].strip()
-            # Only add if there is actual text content
-            if sentence_text:
-                # Recombine the text fragment (sentences[i]) with the delimiter (sentences[i+1])
-                final_sentences.append(sentence_text + sentences[i + 1].strip())
-
-        # Handle the final fragment if it didn't end with a period
-        # (or if the last delimiter was not a period)
-        if len(sentences) % 2 != 0:
-            last_fragment = sentences[-1].strip()
-            if last_fragment:
-                final_sentences.append(last_fragment)
-
-        # Remove any empty strings that might have resulted
-        return [s for s in final_sentences if s]
+        cleaned_paragraph = " ".join(paragraph.split())
+
+        # 2. Every piece but the last was followed by a period, which gets attached back to it
+        *sentences, last_fragment = cleaned_paragraph.split(".")
+        final_sentences = [f"{sentence}." for sentence in map(str.strip, sentences) if sentence]
+
+        # 3. Handle the final fragment that didn't end with a period
+        last_fragment = last_fragment.strip()
+        if last_fragment:
+            final_sentences.append(last_fragment)
+        return final_sentences
 
     def get_n_visible_sentences(
             self, current_y: int, n: int = 5
@@ -413,17 +522,15 @@ class Content(Widget):
         # 2. Define lookahead (to catch phrases split across lines)
         lookahead_buffer = 10
 
-        for linenr in line_range:
-            # Grab a chunk of text starting from this line
-            lines_to_grab = []
-            for i in range(lookahead_buffer):
-                target_line = linenr + i
-                if 0 <= target_line < self.virtual_size.height:
-                    strip = self.get_text_at(target_line, rtl_fix=False)
-                    if strip:
-                        lines_to_grab.append(strip)
+        # 3. Cheap filter: the sentences are made of the chunk's characters in order,
+        # only the periods and whitespaces between them may differ
+        pattern_chars = "".join(pattern_str.split()).replace(".", "")
 
-            chunk_text = " ".join(lines_to_grab)
+        for linenr, window in self.iter_lookahead(line_range, lookahead_buffer, rtl_fix=False):
+            # Grab a chunk of text starting from this line
+            chunk_text = " ".join(text for _, text in window if text)
+            if pattern_chars not in "".join(chunk_text.split()).replace(".", ""):
+                continue
 
             # 4. Use your custom splitter to get the list of sentences
             all_sentences = self.text_to_sentences(chunk_text)
@@ -446,17 +553,27 @@ class Content(Widget):
         if not self.config.show_image_as_ansi:
             return
 
-        # TODO: lazy load the images
-        # 1. Need to change how reading prog saved
-        #    instead of global 30%, save local by segment (ie. segment 3, 60%)
-        # 2. Only load image when scrolled in view. (Checkout `scroll_visible` in Widget/Screen)
+        # NOTE: only decode the images within a screen above/below the visible one,
+        # the rest are decoded once scrolled into view
+        screen_height = self.screen.size.height
+        top = int(self.screen.scroll_y) - self.virtual_region.y - screen_height
+        visible_window = Region(0, top, self.size.width, screen_height * 3)
         for segment in self._segments:
-            if isinstance(segment, Image):
+            if isinstance(segment, Image) and segment.virtual_region_with_margin.overlaps(visible_window):
                 segment.show_ansi_image()
-        self.refresh(layout=True)
+
+    def on_mount(self):
+        self.watch(self.screen, "scroll_y", self._on_screen_scroll_y, init=False)
+
+    def _on_screen_scroll_y(self, _: float) -> None:
+        if self.display:
+            self.show_ansi_images()
 
     def on_resize(self):
-        self.show_ansi_images()
+        # NOTE: debounce so rapid resizes don't decode the images on every step
+        if self._resize_timer is not None:
+            self._resize_timer.stop()
+        self._resize_timer = self.set_timer(0.1, self.show_ansi_images)
 
     # Already handled by self.styles.max_width
     # async def on_resize(self, event: events.Resize) -> None:
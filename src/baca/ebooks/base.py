@@ -1,8 +1,11 @@
+import io
 import shutil
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from typing import Iterator
 
+from PIL import Image as PILImage
+
 from baca.models import BookMetadata, Segment, TocEntry
 
 
@@ -22,6 +25,10 @@ class Ebook:
     def get_img_bytestr(self, image_id: str) -> tuple[str, bytes]:
         raise NotImplementedError()
 
+    def get_img_size(self, image_id: str) -> tuple[int, int]:
+        with PILImage.open(io.BytesIO(self.get_img_bytestr(image_id)[1])) as img:
+            return img.size
+
     def cleanup(self) -> None:
         shutil.rmtree(self.get_tempdir())
 
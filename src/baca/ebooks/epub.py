@@ -1,12 +1,15 @@
 import dataclasses
+import functools
 import os
 import xml.etree.ElementTree as ET
 import zipfile
 import zlib
 from pathlib import Path
-from typing import Callable, Iterator
+from typing import IO, Callable, Iterator
 from urllib.parse import unquote, urljoin, urlparse
 
+from PIL import Image as PILImage
+
 from baca.ebooks.base import Ebook
 from baca.models import BookMetadata, Segment, TocEntry
 from baca.utils.html_parser import parse_html_to_segmented_md
@@ -147,14 +150,20 @@ class Epub(Ebook):
     def get_tempdir(self) -> Path:
         return self._tempdir
 
-    def get_meta(self) -> BookMetadata:
+    @functools.cached_property
+    def _meta(self) -> BookMetadata:
+        # NOTE: cached since every access of self._content_opf re-parses content.opf
+        content_opf = self._content_opf
         metadata: dict[str, str | None] = {}
         for field in dataclasses.fields(BookMetadata):
-            element = self._content_opf.find(f".//DC:{field.name}", Epub.NAMESPACE)
+            element = content_opf.find(f".//DC:{field.name}", Epub.NAMESPACE)
             if element is not None:
                 metadata[field.name] = element.text
         return BookMetadata(**metadata)
 
+    def get_meta(self) -> BookMetadata:
+        return self._meta
+
     def get_toc(self) -> tuple[TocEntry, ...]:
         return Epub._parse_toc(self._toc_ncx, self._version, self._root_dirpath)
 
@@ -183,6 +192,22 @@ class Epub(Ebook):
         unquoted_impath = unquote(impath)
         return os.path.basename(unquoted_impath), self._file.read(unquoted_impath)
 
+    def _open_img(self, impath: str) -> IO[bytes]:
+        return self._file.open(unquote(impath))
+
+    @functools.cached_property
+    def _img_sizes(self) -> dict[str, tuple[int, int]]:
+        return {}
+
+    def get_img_size(self, impath: str) -> tuple[int, int]:
+        size = self._img_sizes.get(impath)
+        if size is None:
+            # NOTE: PIL only parses the header on open, so just that part
+            # of the image is read (and inflated) instead of the whole file
+            with self._open_img(impath) as f, PILImage.open(f) as img:
+                size = self._img_sizes[impath] = img.size
+        return size
+
     def iter_parsed_contents(self) -> Iterator[Segment]:
         toc_entries = self.get_toc()
         for content in self._get_contents():
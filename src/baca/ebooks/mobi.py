@@ -4,6 +4,7 @@ import tempfile
 import xml.etree.ElementTree as ET
 from enum import Enum
 from pathlib import Path
+from typing import IO
 
 from baca import __appname__
 from baca.ebooks.epub import Epub
@@ -71,11 +72,16 @@ class Mobi(Epub):
         with open(content_path, encoding="utf8") as f:
             return f.read()
 
-    def get_img_bytestr(self, impath: str) -> tuple[str, bytes]:
+    def _img_abspath(self, impath: str) -> str:
         # TODO: test on windows, maybe urljoin?
         # if impath "Images/asdf.png" is problematic
         image_abspath = self._root_dirpath / impath
-        image_abspath = os.path.normpath(image_abspath)  # handle crossplatform path
-        with open(image_abspath, "rb") as f:
+        return os.path.normpath(image_abspath)  # handle crossplatform path
+
+    def get_img_bytestr(self, impath: str) -> tuple[str, bytes]:
+        with open(self._img_abspath(impath), "rb") as f:
             src = f.read()
         return impath, src
+
+    def _open_img(self, impath: str) -> IO[bytes]:
+        return open(self._img_abspath(impath), "rb")
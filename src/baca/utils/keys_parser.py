@@ -1,4 +1,5 @@
 import inspect
+from typing import Callable
 
 from textual import events
 from textual.actions import SkipAction
@@ -6,8 +7,15 @@ from textual.actions import SkipAction
 from baca.models import KeyMap
 
 
-async def dispatch_key(maps: list[KeyMap], event: events.Key, *, propagate: bool = True) -> None:
-    callback = {k: m.action for m in maps for k in m.keys}.get(event.key)
+def build_keymap_table(maps: list[KeyMap]) -> dict[str, Callable]:
+    return {k: m.action for m in maps for k in m.keys}
+
+
+async def dispatch_key(
+    maps: list[KeyMap] | dict[str, Callable], event: events.Key, *, propagate: bool = True
+) -> None:
+    # NOTE: pass a prebuilt table from build_keymap_table() for handlers called on every keypress
+    callback = (maps if isinstance(maps, dict) else build_keymap_table(maps)).get(event.key)
 
     if callback is not None:
         try:
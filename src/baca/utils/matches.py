@@ -0,0 +1,60 @@
+import os
+import pickle
+from pathlib import Path
+
+import ijson
+
+from baca.utils.user_appdirs import retrieve_user_cache_matchesfile
+
+MATCHES_JSON = Path("matches.json")
+
+
+def build_match_index(json_path: Path = MATCHES_JSON) -> dict[str, str]:
+    """
+    Map both the eng and heb lines of every record to their counterpart.
+    """
+    matching_lines: dict[str, str] = {}
+    # NOTE: stream the records instead of json.load()
+    # so the raw json list is never materialized next to the index.
+    # make sure json's frame size and n are equals
+    with open(json_path, "rb") as f:
+        for lines_json in ijson.items(f, "item"):
+            # keep the first record on duplicated lines, same as the former linear scan
+            matching_lines.setdefault(lines_json["eng"], lines_json["heb"])
+            matching_lines.setdefault(lines_json["heb"], lines_json["eng"])
+    return matching_lines
+
+
+def load_match_index(json_path: Path = MATCHES_JSON, pkl_path: Path | None = None) -> dict[str, str]:
+    """
+    Load the alignment index from a pickle in the user's cache dir,
+    rebuilding it from the json whenever the json is newer than the pickle.
+    """
+    # no alignment data, every lookup will just be a miss
+    # NOTE: never fall back to a pickle without its json
+    if not json_path.is_file():
+        return {}
+
+    if pkl_path is None:
+        pkl_path = retrieve_user_cache_matchesfile(json_path)
+
+    if pkl_path.is_file() and pkl_path.stat().st_mtime >= json_path.stat().st_mtime:
+        try:
+            with open(pkl_path, "rb") as f:
+                return pickle.load(f)["matches"]
+        except (pickle.UnpicklingError, EOFError, AttributeError, KeyError, TypeError):
+            # truncated/corrupted or of an old format, rebuild it below
+            pass
+
+    matching_lines = build_match_index(json_path)
+    try:
+        # NOTE: dump to a temporary file first so a crash mid-write
+        # won't leave a truncated pickle that looks newer than the json
+        tmp_path = pkl_path.with_suffix(".pkl.tmp")
+        with open(tmp_path, "wb") as f:
+            pickle.dump({"matches": matching_lines}, f, protocol=5)
+        os.replace(tmp_path, pkl_path)
+    except OSError:
+        # cache is optional, e.g. when the cache dir is read-only
+        pass
+    return matching_lines
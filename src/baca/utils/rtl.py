@@ -0,0 +1,29 @@
+import re
+from functools import lru_cache
+
+from bidi.algorithm import get_display
+
+HEBREW_RE = re.compile(r"[\u0590-\u05FF]")
+
+# NOTE: "iw" is the deprecated code still found in older ebooks
+HEBREW_LANGUAGE_CODES = frozenset({"he", "iw", "heb"})
+
+
+def contains_hebrew(text: str) -> bool:
+    # NOTE: isascii() is a flag check on CPython strings,
+    # so the common ascii-only case never reaches the regex
+    if text.isascii():
+        return False
+    return HEBREW_RE.search(text) is not None
+
+
+def is_hebrew_language(language: str) -> bool:
+    # ie. "he", "he-IL", "heb"
+    return language.strip().lower().replace("_", "-").split("-")[0] in HEBREW_LANGUAGE_CODES
+
+
+@lru_cache(maxsize=4096)
+def cached_get_display(text: str) -> str:
+    # NOTE: the same lines get reordered on every repaint/search,
+    # no need to run the whole bidi algorithm on them again
+    return get_display(text)
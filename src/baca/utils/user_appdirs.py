@@ -1,3 +1,4 @@
+import hashlib
 import os
 from pathlib import Path
 
@@ -17,6 +18,16 @@ def retrieve_user_cache_dbfile() -> Path:
     return Path(cachedir) / f"{__appname__}.db"
 
 
+def retrieve_user_cache_matchesfile(json_path: Path) -> Path:
+    cachedir = appdirs.user_cache_dir(__appname__)
+    if not os.path.isdir(cachedir):
+        os.makedirs(cachedir)
+
+    # NOTE: one cache per matches json, the working directory may differ between runs
+    json_key = hashlib.sha1(str(json_path.resolve()).encode("utf-8")).hexdigest()
+    return Path(cachedir) / f"matches-{json_key}.pkl"
+
+
 def retrieve_user_config_file() -> Path:
     configdir = Path(appdirs.user_config_dir(appname=__appname__))
     if not os.path.isdir(configdir):
@@ -0,0 +1,143 @@
+import asyncio
+import zipfile
+
+from baca.app import Baca
+from baca.components.windows import Alert
+from baca.ebooks import Epub
+from baca.models import ReadingHistory
+
+CONTAINER_XML = """<?xml version="1.0"?>
+<container version="1.0" xmlns="urn:oasis:names:tc:opendocument:xmlns:container">
+<rootfiles><rootfile full-path="OEBPS/content.opf" media-type="application/oebps-package+xml"/></rootfiles>
+</container>"""
+
+CONTENT_OPF = """<?xml version="1.0"?>
+<package xmlns="http://www.idpf.org/2007/opf" version="2.0">
+<metadata xmlns:dc="http://purl.org/dc/elements/1.1/"><dc:title>{title}</dc:title><dc:language>en</dc:language></metadata>
+<manifest>
+<item id="ncx" href="toc.ncx" media-type="application/x-dtbncx+xml"/>
+<item id="c1" href="c1.xhtml" media-type="application/xhtml+xml"/>
+</manifest>
+<spine toc="ncx"><itemref idref="c1"/></spine>
+</package>"""
+
+TOC_NCX = """<?xml version="1.0"?>
+<ncx xmlns="http://www.daisy.org/z3986/2005/ncx/" version="2005-1">
+<navMap><navPoint id="n1"><navLabel><text>One</text></navLabel><content src="c1.xhtml"/></navPoint></navMap>
+</ncx>"""
+
+CHAPTER_XHTML = """<html xmlns="http://www.w3.org/1999/xhtml"><head><title>{title}</title></head>
+<body>{paragraphs}</body></html>"""
+
+
+def write_epub(path, title, n_paragraphs=1):
+    paragraphs = "".join(f"<p>{title} paragraph {n}. It goes on for a while.</p>" for n in range(n_paragraphs))
+    with zipfile.ZipFile(path, "w") as f:
+        f.writestr("mimetype", "application/epub+zip")
+        f.writestr("META-INF/container.xml", CONTAINER_XML)
+        f.writestr("OEBPS/content.opf", CONTENT_OPF.format(title=title))
+        f.writestr("OEBPS/toc.ncx", TOC_NCX)
+        f.writestr("OEBPS/c1.xhtml", CHAPTER_XHTML.format(title=title, paragraphs=paragraphs))
+    return path
+
+
+class NoHistoryBaca(Baca):
+    # NOTE: keep the tests off the user's reading history db
+    async def load_ebook(self, path):
+        ebook = await asyncio.to_thread(self.ebook_class, path)
+        return ebook, ReadingHistory(filepath=str(ebook.get_path()), reading_progress=0.0)
+
+
+async def run_switch_book(ebook_paths):
+    app = NoHistoryBaca(ebook_paths, Epub)
+    # NOTE: only App.run() sets it, Baca.on_load asserts it
+    app._loop = asyncio.get_running_loop()
+    async with app.run_test() as pilot:
+        for _ in range(100):
+            if app.sessions[0] is not None:
+                break
+            await pilot.pause(0.05)
+        # only the first book is loaded on startup
+        assert app.sessions[1:] == [None] * (len(ebook_paths) - 1)
+
+        await app.action_switch_book()
+        await pilot.pause()
+        # NOTE: checked before exiting, the widgets are torn down with the app
+        displayed = [session is not None and session.content.display for session in app.sessions]
+        alerts = [alert.message for alert in app.query(Alert)]
+        return app, displayed, alerts
+
+
+def test_switch_book_loads_next_book(tmp_path):
+    ebook_paths = [write_epub(tmp_path / "a.epub", "Book A"), write_epub(tmp_path / "b.epub", "Book B")]
+    app, displayed, alerts = asyncio.run(run_switch_book(ebook_paths))
+
+    assert app.current_index == 1
+    assert app.sessions[1] is not None
+    assert app.sessions[1].ebook.get_meta().title == "Book B"
+    assert displayed == [False, True]
+    assert "Loading..." not in alerts
+
+
+def test_switch_book_with_broken_next_book(tmp_path):
+    broken_path = tmp_path / "broken.epub"
+    broken_path.write_bytes(b"not an epub")
+    app, displayed, alerts = asyncio.run(run_switch_book([write_epub(tmp_path / "a.epub", "Book A"), broken_path]))
+
+    # stays on the first book, the broken one is tried again on the next switch
+    assert app.current_index == 0
+    assert app.sessions[1] is None
+    assert displayed == [True, False]
+    assert alerts == ["Error loading broken.epub: File is not a zip file"]
+
+
+def test_single_book_skips_match_index(tmp_path):
+    async def run_single_book():
+        app = NoHistoryBaca([write_epub(tmp_path / "a.epub", "Book A")], Epub)
+        app._loop = asyncio.get_running_loop()
+        async with app.run_test() as pilot:
+            await pilot.pause()
+            return app._match_index_task
+
+    assert asyncio.run(run_single_book()) is None
+
+
+def test_get_matching_lines_with_failed_match_index(tmp_path):
+    async def failing_load():
+        raise ValueError("malformed matches.json")
+
+    async def get_matching_lines():
+        app = Baca([tmp_path / "a.epub", tmp_path / "b.epub"], Epub)
+        app._match_index_task = asyncio.create_task(failing_load())
+        return await app.get_matching_lines("The ash fell.")
+
+    assert asyncio.run(get_matching_lines()) is None
+
+
+def test_switch_book_restores_saved_progress(tmp_path):
+    async def run_switch_books():
+        ebook_paths = [
+            write_epub(tmp_path / "a.epub", "Book A", n_paragraphs=200),
+            write_epub(tmp_path / "b.epub", "Book B", n_paragraphs=200),
+        ]
+        app = NoHistoryBaca(ebook_paths, Epub)
+        app._loop = asyncio.get_running_loop()
+        async with app.run_test() as pilot:
+            for _ in range(100):
+                if app.sessions[0] is not None and app.screen.max_scroll_y > 0:
+                    break
+                await pilot.pause(0.05)
+
+            progresses = []
+            for progress in (0.25, 0.75):
+                app.screen.scroll_to(None, progress * app.screen.max_scroll_y, animate=False)
+                await pilot.pause()
+                await app.action_switch_book()
+                await pilot.pause(0.1)
+                progresses.append(app.screen.scroll_y / app.screen.max_scroll_y)
+            return progresses
+
+    # books in the same language aren't aligned, each one is back where it was left
+    progress_b, progress_a = asyncio.run(run_switch_books())
+    assert progress_b == 0.0
+    assert abs(progress_a - 0.25) < 0.01
@@ -0,0 +1,83 @@
+import asyncio
+from types import SimpleNamespace
+
+from baca.components.contents import Content
+from baca.models import Coordinate
+
+SENTENCES_TEST = [
+    ("", []),
+    ("   ", []),
+    ("One sentence.", ["One sentence."]),
+    ("No period at the end", ["No period at the end"]),
+    ("First.  Second.\n\tThird", ["First.", "Second.", "Third"]),
+    ("Trailing space.   ", ["Trailing space."]),
+    ("Mixed!  Still one. Two?", ["Mixed! Still one.", "Two?"]),
+    ("Wait... what?", ["Wait.", "what?"]),
+    ("Ends with dots...", ["Ends with dots."]),
+    ("...", []),
+    ("a .b. c", ["a.", "b.", "c"]),
+]
+
+
+def test_text_to_sentences():
+    for paragraph, sentences in SENTENCES_TEST:
+        # NOTE: text_to_sentences doesn't touch the widget
+        assert Content.text_to_sentences(None, paragraph) == sentences, paragraph
+
+
+def _lookahead_windows(height, line_range, lookahead_buffer, forward):
+    fetched = []
+
+    def get_text_at(y, rtl_fix=True):
+        fetched.append(y)
+        return f"line {y}"
+
+    content = SimpleNamespace(virtual_size=SimpleNamespace(height=height), get_text_at=get_text_at)
+    windows = [
+        (linenr, list(window))
+        for linenr, window in Content.iter_lookahead(content, line_range, lookahead_buffer, forward=forward)
+    ]
+    return windows, fetched
+
+
+def test_iter_lookahead():
+    height, lookahead_buffer = 8, 3
+    for line_range, forward in [
+        (range(0, height), True),
+        (reversed(range(0, height)), False),
+        # NOTE: starting outside the book
+        (range(-4, height + 2), True),
+        (reversed(range(-2, height + 4)), False),
+    ]:
+        line_range = list(line_range)
+        step = 1 if forward else -1
+        windows, fetched = _lookahead_windows(height, line_range, lookahead_buffer, forward)
+        assert [linenr for linenr, _ in windows] == line_range
+        for linenr, window in windows:
+            expected = [
+                (y, f"line {y}") for y in range(linenr, linenr + step * lookahead_buffer, step) if 0 <= y < height
+            ]
+            assert window == expected, (linenr, forward)
+        # NOTE: every line is fetched only once
+        assert sorted(fetched) == list(range(height))
+
+
+# NOTE: justified lines, as rendered, with padded spaces and an ellipsis
+ALIGNMENT_LINES = [
+    "Intro sentence.  The   quick  brown fox...",
+    "jumps   over the  lazy dog.  It   was.",
+    "Very  quick... Done.",
+]
+
+
+def test_alignment_search_justified_lines():
+    def get_text_at(y, rtl_fix=True):
+        return ALIGNMENT_LINES[y]
+
+    content = SimpleNamespace(virtual_size=SimpleNamespace(height=len(ALIGNMENT_LINES)), get_text_at=get_text_at)
+    content.iter_lookahead = lambda *args, **kwargs: Content.iter_lookahead(content, *args, **kwargs)
+    content.text_to_sentences = lambda paragraph: Content.text_to_sentences(content, paragraph)
+
+    pattern_str = "The quick brown fox. jumps over the lazy dog. It was. Very quick. Done."
+    assert asyncio.run(Content.alignment_search(content, pattern_str, Coordinate(0, 0))) == 1
+    assert asyncio.run(Content.alignment_search(content, "The quick red fox.", Coordinate(0, 0))) is None
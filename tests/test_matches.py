@@ -0,0 +1,61 @@
+import json
+import os
+
+import baca.utils.matches
+from baca.utils.matches import build_match_index, load_match_index
+
+MATCHES = [
+    {"eng": "Vin sat quietly.", "heb": "וין ישבה בשקט."},
+    {"eng": "The ash fell.", "heb": "האפר ירד."},
+    {"eng": "The ash fell.", "heb": "האפר נפל."},
+]
+
+
+def write_matches(tmp_path):
+    json_path = tmp_path / "matches.json"
+    json_path.write_text(json.dumps(MATCHES, ensure_ascii=False), encoding="utf-8")
+    return json_path
+
+
+def test_build_match_index(tmp_path):
+    json_path = write_matches(tmp_path)
+
+    matching_lines = build_match_index(json_path)
+    assert matching_lines["Vin sat quietly."] == "וין ישבה בשקט."
+    assert matching_lines["האפר נפל."] == "The ash fell."
+    # first record wins on duplicated lines
+    assert matching_lines["The ash fell."] == "האפר ירד."
+    assert "Not in the corpus." not in matching_lines
+
+
+def test_load_match_index_uses_pickle_cache(tmp_path, monkeypatch):
+    json_path = write_matches(tmp_path)
+    pkl_path = tmp_path / "cache" / "matches.pkl"
+    pkl_path.parent.mkdir()
+
+    matching_lines = load_match_index(json_path, pkl_path)
+    assert pkl_path.is_file()
+    assert matching_lines == build_match_index(json_path)
+
+    # served from the pickle as long as it isn't older than the json
+    def fail(_):
+        raise AssertionError("matches.json parsed again")
+
+    monkeypatch.setattr(baca.utils.matches, "build_match_index", fail)
+    assert load_match_index(json_path, pkl_path) == matching_lines
+
+
+def test_load_match_index_rebuilds_corrupted_pickle(tmp_path):
+    json_path = write_matches(tmp_path)
+    pkl_path = tmp_path / "matches.pkl"
+    pkl_path.write_bytes(b"\x80\x05truncated")
+    json_mtime = json_path.stat().st_mtime
+    os.utime(pkl_path, (json_mtime + 1, json_mtime + 1))
+
+    assert load_match_index(json_path, pkl_path) == build_match_index(json_path)
+
+
+def test_load_match_index_without_matches(tmp_path):
+    # a pickle without its json is never loaded
+    (tmp_path / "matches.pkl").write_bytes(b"not a pickle")
+    assert load_match_index(tmp_path / "matches.json", tmp_path / "matches.pkl") == {}
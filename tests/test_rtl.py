@@ -0,0 +1,27 @@
+from bidi.algorithm import get_display
+
+from baca.utils.rtl import cached_get_display, contains_hebrew, is_hebrew_language
+
+
+def test_contains_hebrew():
+    assert not contains_hebrew("alice.epub")
+    assert not contains_hebrew("")
+    assert not contains_hebrew("café – naïve.epub")
+    assert contains_hebrew("ספר.epub")
+    assert contains_hebrew("chapter 1: שלום")
+
+
+def test_cached_get_display():
+    line = "פרק 1: hello שלום."
+    assert cached_get_display(line) == get_display(line)
+    assert cached_get_display(line) == get_display(line)
+
+
+def test_is_hebrew_language():
+    assert is_hebrew_language("he")
+    assert is_hebrew_language("he-IL")
+    assert is_hebrew_language("HEB")
+    assert is_hebrew_language("iw")
+    assert not is_hebrew_language("en")
+    assert not is_hebrew_language("en-US")
+    assert not is_hebrew_language("hr")